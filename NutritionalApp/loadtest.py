@@ -0,0 +1,220 @@
+# ----------------------------------------------------
+# loadtest.py — headless load test for app.py
+# ----------------------------------------------------
+# Drives N simulated sessions through the full page flow
+# (Enter Your Data -> Meal Plan -> select plan -> Cooking Instructions
+#  -> Grocery List -> Stats) with Streamlit's AppTest, concurrently,
+# and reports rerun latency percentiles, throughput and memory.
+#
+# AppTest shares one global Runtime per process, so sessions run in
+# separate worker processes rather than threads. Each worker is warmed
+# up before timing starts, and a session's first run (AppTest setup)
+# is reported as "session start", apart from the rerun percentiles.
+#
+# Usage:
+#   python loadtest.py --sessions 20 --concurrency 8
+#
+# The report goes to stdout; Streamlit's own warnings go to stderr.
+# ----------------------------------------------------
+import argparse
+import os
+import pickle
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+# ----------------------------------------------------
+# HELPERS
+# ----------------------------------------------------
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def session_state_kb(at):
+    size = 0
+    for key, value in at.session_state.to_dict().items():
+        try:
+            size += len(pickle.dumps((key, value)))
+        except Exception:
+            size += sys.getsizeof(value)
+    return size / 1024
+
+def timed_run(at, step, timings):
+    start = time.perf_counter()
+    at.run()
+    timings.append((step, time.perf_counter() - start))
+    if at.exception:
+        raise RuntimeError(f"{step}: {at.exception[0].value}")
+
+# ----------------------------------------------------
+# ONE SIMULATED SESSION
+# ----------------------------------------------------
+def run_session(session_id, seed, timeout, trace_memory=False):
+    rng = random.Random(seed + session_id)
+    # AppTest swaps app.py in as __main__; restore it so the worker can
+    # still unpickle its next task
+    main_module = sys.modules["__main__"]
+    timings = []
+    result = {"session": session_id, "pid": os.getpid(), "timings": timings, "error": None,
+              "state_kb": 0.0, "start_time": None}
+    if trace_memory:
+        tracemalloc.start()
+    started = time.time()
+
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        start_timings = []
+        timed_run(at, "home", start_timings)
+        result["start_time"] = start_timings[0][1]
+
+        at.button(key="start_now").click()
+        timed_run(at, "enter_data", timings)
+
+        at.number_input(key="age_input").set_value(rng.randint(18, 65))
+        at.number_input(key="weight_input").set_value(rng.randint(50, 120))
+        at.number_input(key="height_input").set_value(rng.randint(150, 200))
+        at.selectbox(key="goal_select").set_value(rng.choice(["Weight Loss", "Maintenance", "Muscle Gain"]))
+        at.selectbox(key="diet_select").set_value(rng.choice(["Omnivore", "Vegetarian", "Vegan"]))
+        difficulty = rng.choice(["Simple", "Pro Mode"])
+        at.button(key=f"diff_{difficulty}").click()
+        timed_run(at, "difficulty", timings)
+
+        if difficulty == "Pro Mode":
+            at.radio(key="snack_radio").set_value(rng.choice(["No", "Yes"]))
+            timed_run(at, "snack", timings)
+
+        at.button(key="save_data").click()
+        timed_run(at, "save_data", timings)
+
+        at.button(key="generate_plans").click()
+        timed_run(at, "meal_plan", timings)
+
+        at.button(key=f"plan_select_{rng.randint(0, 2)}").click()
+        timed_run(at, "select_plan", timings)
+
+        at.button(key="to_cooking").click()
+        timed_run(at, "cooking", timings)
+
+        at.button(key="to_grocery").click()
+        timed_run(at, "grocery", timings)
+
+        at.button(key="to_stats").click()
+        timed_run(at, "stats", timings)
+
+        if at.session_state["current_page"] != "Stats":
+            raise RuntimeError(f"ended on page {at.session_state['current_page']!r}, expected 'Stats'")
+        result["state_kb"] = session_state_kb(at)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        sys.modules["__main__"] = main_module
+
+    result["started"] = started
+    result["finished"] = time.time()
+    if trace_memory:
+        result["alloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    result["worker_rss_mb"] = peak_rss_mb()
+    return result
+
+def warm_up_worker(seed, timeout):
+    # One untimed pass through every page, so Streamlit's lazy imports and
+    # the first script compile are paid outside the measured sessions
+    run_session(-1, seed, timeout)
+
+# ----------------------------------------------------
+# REPORT
+# ----------------------------------------------------
+def summarize(results, concurrency):
+    # Throughput window: earliest session start to latest session end,
+    # so worker spawn and warm-up are not counted
+    wall_time = max(r["finished"] for r in results) - min(r["started"] for r in results) or 1e-9
+    latencies = np.array([t for r in results for _, t in r["timings"]]) * 1000
+    failures = [r for r in results if r["error"]]
+    completed = len(results) - len(failures)
+    state_kb = [r["state_kb"] for r in results if not r["error"]]
+
+    print(f"Sessions:        {len(results)} ({completed} completed, {len(failures)} failed)")
+    print(f"Concurrency:     {concurrency}")
+    print(f"Wall time:       {wall_time:.2f} s")
+    print(f"Throughput:      {len(latencies) / wall_time:.2f} reruns/s | {completed / wall_time:.2f} sessions/s")
+
+    start_times = np.array([r["start_time"] for r in results if r["start_time"] is not None]) * 1000
+    if len(start_times):
+        s50, s95 = np.percentile(start_times, [50, 95])
+        print(f"Session start:   p50 {s50:.1f} ms | p95 {s95:.1f} ms | max {start_times.max():.1f} ms "
+              f"(AppTest setup + first run, excluded below)")
+
+    if len(latencies):
+        p50, p90, p95, p99 = np.percentile(latencies, [50, 90, 95, 99])
+        print(f"Rerun latency:   p50 {p50:.1f} ms | p90 {p90:.1f} ms | p95 {p95:.1f} ms | "
+              f"p99 {p99:.1f} ms | max {latencies.max():.1f} ms")
+
+        print("Per step (p50 / p95 ms):")
+        steps = {}
+        for r in results:
+            for step, t in r["timings"]:
+                steps.setdefault(step, []).append(t * 1000)
+        for step, values in steps.items():
+            s50, s95 = np.percentile(values, [50, 95])
+            print(f"  {step:<12} {s50:8.1f} / {s95:8.1f}  (n={len(values)})")
+
+    if state_kb:
+        print(f"Session state:   mean {np.mean(state_kb):.1f} KB | max {np.max(state_kb):.1f} KB per session")
+    alloc = [r["alloc_peak_mb"] for r in results if r.get("alloc_peak_mb") is not None]
+    if alloc:
+        print(f"Alloc peak:      mean {np.mean(alloc):.1f} MB | max {np.max(alloc):.1f} MB per session")
+    else:
+        print("Alloc peak:      not measured; pass --trace-memory for per-session memory")
+    worker_rss = {}
+    for r in results:
+        if r["worker_rss_mb"] is not None:
+            worker_rss[r["pid"]] = max(worker_rss.get(r["pid"], 0), r["worker_rss_mb"])
+    if worker_rss:
+        print(f"Worker peak RSS: mean {np.mean(list(worker_rss.values())):.1f} MB | "
+              f"max {max(worker_rss.values()):.1f} MB over {len(worker_rss)} worker(s) "
+              f"(whole-process high-water mark, not per session)")
+
+    for r in failures:
+        print(f"  session {r['session']} failed: {r['error']}")
+
+    return 1 if failures else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent app sessions and report rerun performance.")
+    parser.add_argument("--sessions", type=int, default=10, help="total number of simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=4, help="sessions running at the same time")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random user inputs")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record per-session allocation peak with tracemalloc (slows reruns)")
+    args = parser.parse_args(argv)
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    session = partial(run_session, seed=args.seed, timeout=args.timeout, trace_memory=args.trace_memory)
+    with ProcessPoolExecutor(max_workers=args.concurrency, initializer=warm_up_worker,
+                             initargs=(args.seed, args.timeout)) as pool:
+        results = list(pool.map(session, range(args.sessions)))
+
+    return summarize(results, args.concurrency)
+
+
+if __name__ == "__main__":
+    sys.exit(main())